@@ -14,16 +14,33 @@ Usage:
 """
 
 import json
+import os
+import re
 import sys
 import subprocess
 import shutil
+import sqlite3
+import threading
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
-from collections import defaultdict
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from dataclasses import dataclass, field
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+import heapq
 import argparse
 
+# orjson is optional: it parses several times faster than the stdlib json
+# module and accepts raw bytes, so session files can be read in binary mode.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.widgets import (
@@ -31,7 +48,11 @@ from textual.widgets import (
     Input, Button, TabbedContent, TabPane, Markdown, RichLog, TextArea
 )
 from textual.binding import Binding
+from textual import work
+from textual.worker import get_current_worker
 from textual.screen import Screen
+from textual.widgets.text_area import Edit, EditResult, WrappedDocument
+from textual.timer import Timer
 from textual import events
 from rich.syntax import Syntax
 from rich.markdown import Markdown as RichMarkdown
@@ -39,11 +60,162 @@ from rich.table import Table as RichTable
 from rich.text import Text
 
 
+_json_loads = orjson.loads if orjson else json.loads
+
+# JSONL entry types that represent conversation messages
+_MESSAGE_TYPES = frozenset(('user', 'assistant'))
+
+# Byte-level prefilter for lines that may hold a user/assistant message.
+# It can match nested objects too, so the parsed 'type' is still checked.
+_MESSAGE_LINE_RE = re.compile(rb'"type":\s*"(?:user|assistant)"')
+
+# Phrases used to pick a session description from its first user messages (lowercase).
+# Each list is compiled into one alternation so a message is scanned once per list.
+_DESCRIPTION_SKIP_PATTERNS = [
+    # Continuation phrases
+    'continue', 'ok', 'yes', 'go ahead', 'proceed', 'sure',
+    'please continue', 'keep going', 'go on',
+    'continuing from', 'resuming', 'resume from',
+    'sounds good', 'looks good', 'perfect', 'great',
+    'done', 'finished', 'completed',
+    # System/automated messages
+    'caveat:', 'the messages below were generated',
+    '<command-name>', '<local-command-stdout>', '<command-message>',
+    'context usage', 'mcp tools', 'memory files',
+    '/context', '/model', 'set model to'
+]
+# System/automated messages, matched against the start of a message only
+_DESCRIPTION_SYSTEM_PATTERNS = [
+    'caveat:', '<command-name>', '<local-command-stdout>',
+    'the messages below were generated', 'context usage',
+    '/context', '/model', 'set model to'
+]
+# Task/request indicators
+_DESCRIPTION_TASK_PATTERNS = [
+    # Imperative verbs
+    'help', 'create', 'make', 'fix', 'add', 'update', 'change', 'modify',
+    'remove', 'delete', 'build', 'implement', 'write', 'read', 'show',
+    'display', 'check', 'test', 'review', 'analyze', 'debug', 'install',
+    'configure', 'setup', 'deploy', 'run', 'execute', 'search', 'find',
+    # Question words
+    'how', 'what', 'when', 'where', 'why', 'which', 'who',
+    'can you', 'could you', 'would you', 'will you',
+    # Request patterns
+    'i need', 'i want', 'i would like', 'please', 'let\'s'
+]
+# Skip patterns that start with a word must start a word too, so 'ok' doesn't match "book".
+# One shared \b in front of their group keeps the alternation nearly as fast as plain substrings.
+_DESCRIPTION_SKIP_RE = re.compile(
+    '|'.join(re.escape(p) for p in _DESCRIPTION_SKIP_PATTERNS if not p[0].isalnum())
+    + r'|\b(?:' + '|'.join(re.escape(p) for p in _DESCRIPTION_SKIP_PATTERNS if p[0].isalnum()) + ')')
+_DESCRIPTION_SYSTEM_RE = re.compile('|'.join(map(re.escape, _DESCRIPTION_SYSTEM_PATTERNS)))
+_DESCRIPTION_TASK_RE = re.compile('|'.join(map(re.escape, _DESCRIPTION_TASK_PATTERNS)))
+
+# Shared default for dict.get() in the scan loop, so missing keys don't allocate; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# Buffer size for reading session JSONL files; large sessions are many MB
+_READ_BUFFER_SIZE = 1024 * 1024
+
+# Rule line framing each message header in the conversation view
+_SEPARATOR = "=" * 80
+
+
+def _json_dumps_indented(obj: Any) -> str:
+    """Pretty-print a JSON value with a 2-space indent, using orjson when available."""
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            # orjson rejects some values the stdlib accepts (e.g. >64-bit ints)
+            pass
+    return json.dumps(obj, indent=2)
+
+
+def _format_datetime(dt: datetime) -> str:
+    """Format as YYYY-MM-DD HH:MM:SS (faster than the equivalent strftime)."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' for UTC from 3.11 on
+    _parse_ts = datetime.fromisoformat
+else:
+    def _parse_ts(ts: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC."""
+        if ts.endswith('Z'):
+            ts = ts[:-1] + '+00:00'
+        return datetime.fromisoformat(ts)
+
+
+@lru_cache(maxsize=64)
+def _search_pattern(term: str) -> Optional[re.Pattern]:
+    """
+    Compile a literal search term, cached so repeated searches skip compiling.
+
+    Returns None if the term can overlap itself ("aa" in "aaa"): finditer() resumes
+    after each match and would miss the overlapping ones.
+    """
+    if any(term[:k] == term[-k:] for k in range(1, len(term))):
+        return None
+    return re.compile(re.escape(term))
+
+
+def _format_text_block(block: Dict[str, Any]) -> str:
+    return block.get('text', '')
+
+
+def _format_tool_use_block(block: Dict[str, Any]) -> str:
+    tool_name = block.get('name', 'unknown')
+    tool_input = _json_dumps_indented(block.get('input', {}))
+    return f"\n[Tool: {tool_name}]\n{tool_input}\n"
+
+
+def _format_tool_result_block(block: Dict[str, Any]) -> Optional[str]:
+    is_error = block.get('is_error', False)
+    result = block.get('content', '')
+    status = "ERROR" if is_error else "OK"
+    if not isinstance(result, str):
+        return None
+    # Truncate long results
+    if len(result) > 1000:
+        result = result[:1000] + f"\n... ({len(result)} chars total)"
+    return f"\n[Tool Result {status}]\n{result}\n"
+
+
+def _format_thinking_block(block: Dict[str, Any]) -> str:
+    thinking = block.get('thinking', '')
+    if len(thinking) > 500:
+        thinking = thinking[:500] + f"... ({len(thinking)} chars total)"
+    return f"\n[Thinking]\n{thinking}\n"
+
+
+def _format_image_block(block: Dict[str, Any]) -> str:
+    source = block.get('source', {})
+    media_type = source.get('media_type', 'unknown')
+    return f"\n[Image: {media_type}]\n"
+
+
+# Content block type -> formatter used by SessionLoader._format_content.
+# A formatter may return None to leave the block out.
+_BLOCK_HANDLERS = {
+    'text': _format_text_block,
+    'tool_use': _format_tool_use_block,
+    'tool_result': _format_tool_result_block,
+    'thinking': _format_thinking_block,
+    'image': _format_image_block,
+}
+
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+# Slotted dataclasses (3.10+) use less memory per instance and have faster attribute access
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SessionMetadata:
     """Metadata for a Claude session."""
     session_id: str
@@ -63,13 +235,57 @@ class SessionMetadata:
     cwd: Optional[str] = None
     description: Optional[str] = None  # Auto-generated from first user message
     custom_tag: Optional[str] = None  # User-defined custom tag/description
+    modified_ts: float = 0.0  # st_mtime behind `modified`; a float is cheaper to sort by
+    # Lazily built table strings and search text (see the properties below)
+    _row_cache: Optional[Tuple[str, str, str, str]] = field(default=None, init=False, repr=False, compare=False)
+    _search_cache: Optional[Tuple[Optional[str], str]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.tool_usage is None:
             self.tool_usage = {}
 
-
-@dataclass
+    def display_strings(self) -> Tuple[str, str, str, str]:
+        """Format the date, token, size and message count columns once and reuse them."""
+        if self._row_cache is None:
+            self._row_cache = (
+                _format_datetime(self.modified),
+                f"{self.total_input_tokens + self.total_output_tokens:,}",
+                f"{self.size_bytes / 1024 / 1024:.1f} MB",
+                str(self.message_count),
+            )
+        return self._row_cache
+
+    @property
+    def date_str(self) -> str:
+        return self.display_strings()[0]
+
+    @property
+    def tokens_str(self) -> str:
+        return self.display_strings()[1]
+
+    @property
+    def size_str(self) -> str:
+        return self.display_strings()[2]
+
+    @property
+    def messages_str(self) -> str:
+        return self.display_strings()[3]
+
+    @property
+    def search_blob(self) -> str:
+        """Lowercased searchable fields, rebuilt only when the custom tag changes."""
+        cache = self._search_cache
+        if cache is None or cache[0] is not self.custom_tag:
+            # Newline-separated so a query can't match across two fields
+            blob = '\n'.join(
+                part for part in (self.session_id, self.workspace, self.description,
+                                  self.custom_tag, self.cwd) if part
+            ).lower()
+            cache = self._search_cache = (self.custom_tag, blob)
+        return cache[1]
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Message:
     """A single message in a conversation."""
     role: str  # 'user' or 'assistant'
@@ -79,6 +295,27 @@ class Message:
     line_num: int = 0
     git_branch: Optional[str] = None
     claude_version: Optional[str] = None
+    _meta_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def meta_line(self) -> str:
+        """Model, stop reason and token usage summary; formatted once and reused."""
+        if self._meta_cache is None:
+            meta_parts = []
+            metadata = self.metadata
+            if metadata:
+                if metadata.get('model'):
+                    meta_parts.append(f"Model: {metadata['model']}")
+                if metadata.get('stop_reason'):
+                    meta_parts.append(f"Stop: {metadata['stop_reason']}")
+                if metadata.get('usage'):
+                    usage = metadata['usage']
+                    tokens = f"Tokens: in={usage.get('input_tokens', 0)}, out={usage.get('output_tokens', 0)}"
+                    if usage.get('cache_read_input_tokens'):
+                        tokens += f", cache_read={usage['cache_read_input_tokens']}"
+                    meta_parts.append(tokens)
+            self._meta_cache = ' | '.join(meta_parts)
+        return self._meta_cache
 
 
 # ============================================================================
@@ -88,22 +325,46 @@ class Message:
 class SessionLoader:
     """Loads and parses Claude session files."""
 
+    # Bump whenever the cached metadata layout or the extraction logic changes
+    CACHE_VERSION = 3
+
+    # Number of user messages sampled for the auto-generated description
+    DESCRIPTION_SAMPLES = 10
+
+    # Parsed conversations of the most recently viewed sessions, keyed by path and
+    # bounded by count and by the approximate size of the message text they hold.
+    # Cached Message objects are shared between loads, so callers must not modify them.
+    MESSAGE_CACHE_SIZE = 4
+    MESSAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    _message_cache: "OrderedDict[str, Tuple[Tuple[int, int], List[Message], int]]" = OrderedDict()
+    _message_cache_bytes = 0
+    _message_cache_lock = threading.Lock()
+
+    # Set by get_claude_dir() once the directory has been found
+    _claude_dir: Optional[Path] = None
+
+    # In-memory copy of the metadata cache as (cache file, entries by path), so listings
+    # after the first in a process skip reading and decoding the whole database
+    _entry_cache: Optional[Tuple[str, Dict[str, Dict[str, Any]]]] = None
+    _entry_cache_lock = threading.Lock()
+
     @staticmethod
     def _get_meta_file(session_file: Path) -> Path:
         """Get the sidecar metadata file path for a session."""
         return session_file.with_suffix('.meta.json')
 
     @staticmethod
-    def _load_custom_tag(session_file: Path) -> Optional[str]:
+    def _load_custom_tag(session_file: str) -> Optional[str]:
         """Load custom tag from sidecar metadata file if it exists."""
-        meta_file = SessionLoader._get_meta_file(session_file)
-        if meta_file.exists():
-            try:
-                with open(meta_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('custom_tag')
-            except Exception:
-                pass
+        # Same file as _get_meta_file(), built from the string to skip Path objects when listing
+        meta_file = os.path.splitext(session_file)[0] + '.meta.json'
+        # Most sessions have no tag; opening directly saves a separate exists() stat
+        try:
+            with open(meta_file, 'rb') as f:
+                data = _json_loads(f.read())
+                return data.get('custom_tag')
+        except Exception:
+            pass
         return None
 
     @staticmethod
@@ -112,10 +373,20 @@ class SessionLoader:
         meta_file = SessionLoader._get_meta_file(session_file)
         try:
             if custom_tag:
-                # Save tag to metadata file
+                # Save tag to metadata file; write a temp file and rename it over the
+                # old one so an interrupted save can't leave a truncated file behind
                 data = {'custom_tag': custom_tag}
-                with open(meta_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+                tmp_file = meta_file.with_name(meta_file.name + '.tmp')
+                try:
+                    with open(tmp_file, 'w', encoding='utf-8') as f:
+                        f.write(_json_dumps_indented(data))
+                    os.replace(tmp_file, meta_file)
+                except Exception:
+                    try:
+                        tmp_file.unlink()
+                    except OSError:
+                        pass
+                    raise
             else:
                 # Remove metadata file if tag is empty/None
                 if meta_file.exists():
@@ -124,14 +395,170 @@ class SessionLoader:
         except Exception:
             return False
 
+    @staticmethod
+    def _get_cache_file() -> Path:
+        """Get the path of the persistent session metadata cache."""
+        return Path.home() / ".claude" / ".session-tui-cache.sqlite"
+
+    @staticmethod
+    def _load_cache() -> Dict[str, Dict[str, Any]]:
+        """Load cached session metadata, keyed by session file path (a copy; safe to modify)."""
+        cache_file = str(SessionLoader._get_cache_file())
+        with SessionLoader._entry_cache_lock:
+            memory = SessionLoader._entry_cache
+            if memory is not None and memory[0] == cache_file:
+                return dict(memory[1])
+
+        cache = SessionLoader._read_cache_file(cache_file)
+        with SessionLoader._entry_cache_lock:
+            SessionLoader._entry_cache = (cache_file, dict(cache))
+        return cache
+
+    @staticmethod
+    def _remember_cache(updated: Dict[str, Dict[str, Any]], removed: List[str]) -> None:
+        """Apply saved cache changes to the in-memory copy."""
+        cache_file = str(SessionLoader._get_cache_file())
+        with SessionLoader._entry_cache_lock:
+            memory = SessionLoader._entry_cache
+            if memory is None or memory[0] != cache_file:
+                return
+            memory[1].update(updated)
+            for path in removed:
+                memory[1].pop(path, None)
+
+    @staticmethod
+    def _read_cache_file(cache_file: str) -> Dict[str, Dict[str, Any]]:
+        """Read all cached session metadata from the database."""
+        if not os.path.exists(cache_file):
+            return {}
+        try:
+            conn = sqlite3.connect(cache_file, timeout=5)
+            try:
+                if conn.execute("PRAGMA user_version").fetchone()[0] == SessionLoader.CACHE_VERSION:
+                    return {path: _json_loads(entry)
+                            for path, entry in conn.execute("SELECT path, entry FROM sessions")}
+            finally:
+                conn.close()
+        except Exception:
+            pass
+        return {}
+
+    @staticmethod
+    def _save_cache(updated: Dict[str, Dict[str, Any]], removed: List[str]) -> None:
+        """Write new/changed cache entries and drop removed ones in one transaction (best effort)."""
+        cache_file = SessionLoader._get_cache_file()
+        if not cache_file.parent.exists():
+            return
+        try:
+            conn = sqlite3.connect(str(cache_file), timeout=5)
+            try:
+                # WAL lets another running viewer keep reading while this one writes
+                conn.execute("PRAGMA journal_mode=WAL")
+                with conn:
+                    if conn.execute("PRAGMA user_version").fetchone()[0] != SessionLoader.CACHE_VERSION:
+                        conn.execute("DROP TABLE IF EXISTS sessions")
+                        conn.execute(
+                            "CREATE TABLE sessions ("
+                            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, entry TEXT)"
+                        )
+                        conn.execute(f"PRAGMA user_version = {SessionLoader.CACHE_VERSION}")
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)",
+                        [(path, entry['mtime_ns'], entry['size'], json.dumps(entry))
+                         for path, entry in updated.items()]
+                    )
+                    conn.executemany("DELETE FROM sessions WHERE path = ?", [(path,) for path in removed])
+            finally:
+                conn.close()
+        except Exception:
+            pass
+
+        # Remove the JSON cache written by earlier versions
+        try:
+            cache_file.with_suffix('.json').unlink()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _metadata_from_entry(entry: Dict[str, Any], session_file: str, workspace: str,
+                             stat: os.stat_result) -> SessionMetadata:
+        """Build SessionMetadata from a scan/cache entry and a fresh stat."""
+        # Convert timestamps to datetime if available
+        first_dt = None
+        last_dt = None
+        if entry['first_timestamp']:
+            try:
+                first_dt = _parse_ts(entry['first_timestamp'])
+            except:
+                pass
+        if entry['last_timestamp']:
+            try:
+                last_dt = _parse_ts(entry['last_timestamp'])
+            except:
+                pass
+
+        return SessionMetadata(
+            session_id=os.path.splitext(os.path.basename(session_file))[0],
+            workspace=workspace,
+            file_path=Path(session_file),
+            modified=datetime.fromtimestamp(stat.st_mtime),
+            modified_ts=stat.st_mtime,
+            size_bytes=stat.st_size,
+            message_count=entry['message_count'],
+            first_message_time=first_dt,
+            last_message_time=last_dt,
+            model=entry['model'],
+            total_input_tokens=entry['total_input_tokens'],
+            total_output_tokens=entry['total_output_tokens'],
+            total_cache_read_tokens=entry['total_cache_read_tokens'],
+            total_cache_create_tokens=entry['total_cache_create_tokens'],
+            tool_usage=dict(entry['tool_usage']),
+            cwd=entry['cwd'],
+            description=entry['description'],
+            # The custom tag lives in its own sidecar file, so always read it fresh
+            custom_tag=SessionLoader._load_custom_tag(session_file)
+        )
+
+    @staticmethod
+    def _get_cached_metadata(session_file: str, workspace: str, stat: os.stat_result,
+                             cache: Dict[str, Dict[str, Any]]) -> Optional[SessionMetadata]:
+        """Get session metadata from the cache, or None if the file changed since it was cached."""
+        entry = cache.get(session_file)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            try:
+                return SessionLoader._metadata_from_entry(entry, session_file, workspace, stat)
+            except Exception:
+                pass
+        return None
+
+    @staticmethod
+    def _scan_workers() -> int:
+        """Number of threads used to scan changed session files.
+
+        Override with CLAUDE_SESSION_TUI_WORKERS (e.g. lower it on network filesystems).
+        """
+        try:
+            return max(1, int(os.environ["CLAUDE_SESSION_TUI_WORKERS"]))
+        except (KeyError, ValueError):
+            return min(32, (os.cpu_count() or 1) * 4)
+
     @staticmethod
     def get_claude_dir() -> Path:
         """Get the Claude Code directory."""
-        claude_dir = Path.home() / ".claude"
-        if not claude_dir.exists():
-            raise FileNotFoundError(f"Claude directory not found at {claude_dir}")
+        claude_dir = SessionLoader._claude_dir
+        if claude_dir is None:
+            claude_dir = Path.home() / ".claude"
+            if not claude_dir.exists():
+                raise FileNotFoundError(f"Claude directory not found at {claude_dir}")
+            # The directory doesn't move during a run, so only resolve it once
+            SessionLoader._claude_dir = claude_dir
         return claude_dir
 
+    @staticmethod
+    def _invalidate_claude_dir_cache() -> None:
+        """Forget the resolved Claude directory so the next call looks it up again."""
+        SessionLoader._claude_dir = None
+
     @staticmethod
     def get_all_workspaces() -> List[str]:
         """Get all workspace names."""
@@ -141,12 +568,28 @@ class SessionLoader:
         if not projects_base.exists():
             return []
 
-        return [d.name for d in projects_base.iterdir() if d.is_dir()]
+        with os.scandir(projects_base) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
 
     @staticmethod
-    def list_sessions(workspace: Optional[str] = None, custom_paths: Optional[List[Path]] = None) -> List[SessionMetadata]:
-        """List all sessions, optionally filtered by workspace or from custom paths."""
-        sessions = []
+    def list_sessions(workspace: Optional[str] = None, custom_paths: Optional[List[Path]] = None,
+                      limit: Optional[int] = None) -> List[SessionMetadata]:
+        """List all sessions (or the `limit` newest), optionally filtered by workspace or from custom paths."""
+        sessions = [s for batch in SessionLoader.iter_sessions(workspace, custom_paths, limit) for s in batch]
+
+        # Sort by modification time, most recent first
+        sessions.sort(key=attrgetter('modified_ts'), reverse=True)
+        return sessions
+
+    @staticmethod
+    def _find_session_files(workspace: Optional[str] = None,
+                            custom_paths: Optional[List[Path]] = None) -> List[Tuple[str, str, Optional[os.stat_result]]]:
+        """
+        Find session files as (session_file, workspace, stat or None) tuples.
+
+        Paths are plain strings; listing only turns them into Path objects for SessionMetadata.
+        """
+        candidates = []
 
         # If custom paths are provided, scan those instead of the default location
         if custom_paths:
@@ -156,64 +599,157 @@ class SessionLoader:
 
                 # If it's a directory, scan for .jsonl files recursively
                 if custom_path.is_dir():
-                    for session_file in custom_path.rglob("*.jsonl"):
-                        # Skip history.jsonl and other non-session files
-                        if session_file.name == "history.jsonl":
-                            continue
-                        # Skip agent sessions by default
-                        if session_file.stem.startswith("agent-"):
-                            continue
-
-                        try:
-                            # Use parent directory name as workspace
-                            ws = session_file.parent.name
-                            metadata = SessionLoader._extract_metadata(session_file, ws)
-                            sessions.append(metadata)
-                        except Exception:
-                            continue
+                    candidates.extend(SessionLoader._walk_session_files(custom_path))
                 # If it's a file, try to load it directly
                 elif custom_path.is_file() and custom_path.suffix == ".jsonl":
-                    try:
-                        ws = custom_path.parent.name
-                        metadata = SessionLoader._extract_metadata(custom_path, ws)
-                        sessions.append(metadata)
-                    except Exception:
-                        pass
+                    candidates.append((str(custom_path), custom_path.parent.name, None))
         else:
             # Default behavior: scan ~/.claude/projects/
             claude_dir = SessionLoader.get_claude_dir()
             projects_base = claude_dir / "projects"
 
             if not projects_base.exists():
-                return []
+                return candidates
 
             # Determine which workspaces to scan
             if workspace:
                 workspaces = [workspace]
             else:
-                workspaces = [d.name for d in projects_base.iterdir() if d.is_dir()]
+                with os.scandir(projects_base) as entries:
+                    workspaces = [entry.name for entry in entries if entry.is_dir()]
 
             for ws in workspaces:
-                ws_dir = projects_base / ws
-                if not ws_dir.exists():
+                try:
+                    entries = os.scandir(projects_base / ws)
+                except OSError:
                     continue
 
-                # Find all .jsonl files (excluding agent sessions by default)
-                for session_file in ws_dir.glob("*.jsonl"):
-                    # Skip agent sessions in list view (can still be viewed if opened directly)
-                    if session_file.stem.startswith("agent-"):
-                        continue
+                # Find all .jsonl files (excluding agent sessions by default).
+                # DirEntry caches its stat result, so each file is only stat'ed once.
+                with entries:
+                    for entry in entries:
+                        # Skip agent sessions in list view (can still be viewed if opened directly)
+                        if not entry.name.endswith(".jsonl") or entry.name.startswith("agent-"):
+                            continue
+
+                        try:
+                            if entry.is_file():
+                                candidates.append((entry.path, ws, entry.stat()))
+                        except OSError:
+                            continue
 
+        return candidates
+
+    @staticmethod
+    def _walk_session_files(root: Path) -> Iterator[Tuple[str, str, Optional[os.stat_result]]]:
+        """
+        Recursively find session files under a custom directory with os.scandir.
+
+        Like Path.rglob, symlinked directories are not descended into. Each DirEntry's
+        cached type and stat are reused instead of being looked up again.
+        """
+        stack = [str(root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                # Use parent directory name as workspace
+                ws = Path(directory).name
+                for entry in entries:
+                    name = entry.name
+                    # Match Path's normalization, which drops the "./" scandir('.') puts in front
+                    path = name if directory == '.' else entry.path
                     try:
-                        metadata = SessionLoader._extract_metadata(session_file, ws)
-                        sessions.append(metadata)
-                    except Exception:
-                        # Skip corrupted sessions
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(path)
+                            continue
+                        # Skip history.jsonl and other non-session files, and agent sessions by default
+                        if (not name.endswith(".jsonl") or name == "history.jsonl"
+                                or name.startswith("agent-") or not entry.is_file()):
+                            continue
+                        yield path, ws, entry.stat()
+                    except OSError:
                         continue
 
-        # Sort by modification time, most recent first
-        sessions.sort(key=lambda s: s.modified, reverse=True)
-        return sessions
+    @staticmethod
+    def iter_sessions(workspace: Optional[str] = None, custom_paths: Optional[List[Path]] = None,
+                      limit: Optional[int] = None) -> Iterator[List[SessionMetadata]]:
+        """
+        Yield sessions in unsorted batches as they become available.
+
+        Sessions served from the cache come first as one batch, followed by
+        freshly scanned sessions as their scans finish. With a `limit`, only the
+        most recently modified session files are loaded at all.
+        """
+        candidates = []
+        for session_file, ws, stat in SessionLoader._find_session_files(workspace, custom_paths):
+            try:
+                if stat is None:
+                    stat = os.stat(session_file)
+            except OSError:
+                continue
+            candidates.append((session_file, ws, stat))
+
+        # Pick the newest files by stat alone, before any of them is read
+        if limit is not None:
+            candidates = heapq.nlargest(limit, candidates, key=lambda c: c[2].st_mtime)
+
+        # Serve unchanged sessions from the cache and collect the rest for scanning
+        cache = SessionLoader._load_cache()
+        cached = []
+        to_scan = []
+        for session_file, ws, stat in candidates:
+            metadata = SessionLoader._get_cached_metadata(session_file, ws, stat, cache)
+            if metadata:
+                cached.append(metadata)
+            else:
+                # A stale entry still lets appended-to sessions be scanned incrementally
+                to_scan.append((session_file, ws, stat, cache.get(session_file)))
+
+        if cached:
+            yield cached
+
+        if to_scan:
+            def scan(args):
+                session_file, ws, stat, prior = args
+                try:
+                    entry = SessionLoader._scan_session(session_file, stat, prior)
+                    return entry, SessionLoader._metadata_from_entry(entry, session_file, ws, stat)
+                except Exception:
+                    # Skip corrupted sessions
+                    return None, None
+
+            # Scanning is dominated by file reads, so threads overlap the I/O
+            scanned = {}
+            workers = min(SessionLoader._scan_workers(), len(to_scan))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(scan, args): args[0] for args in to_scan}
+                pending = set(futures)
+                try:
+                    while pending:
+                        # Hand over everything that has finished since the last batch
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        batch = []
+                        for future in done:
+                            entry, metadata = future.result()
+                            if metadata:
+                                batch.append(metadata)
+                                scanned[futures[future]] = entry
+                        if batch:
+                            yield batch
+                finally:
+                    # Don't keep scanning if the caller stopped early
+                    for future in pending:
+                        future.cancel()
+
+            # Drop entries for session files that no longer exist
+            seen = {c[0] for c in candidates}
+            removed = [k for k in cache if k not in seen and not os.path.exists(k)]
+            SessionLoader._save_cache(scanned, removed)
+            SessionLoader._remember_cache(scanned, removed)
 
     @staticmethod
     def _find_meaningful_message(user_messages: List[str]) -> Optional[str]:
@@ -229,62 +765,26 @@ class SessionLoader:
         - Is at least 30 characters long
         - Contains task/request indicators (action verbs, questions, etc.)
         """
-        # Skip patterns (lowercase for case-insensitive matching)
-        skip_patterns = [
-            # Continuation phrases
-            'continue', 'ok', 'yes', 'go ahead', 'proceed', 'sure',
-            'please continue', 'keep going', 'go on',
-            'continuing from', 'resuming', 'resume from',
-            'sounds good', 'looks good', 'perfect', 'great',
-            'done', 'finished', 'completed',
-            # System/automated messages
-            'caveat:', 'the messages below were generated',
-            '<command-name>', '<local-command-stdout>', '<command-message>',
-            'context usage', 'mcp tools', 'memory files',
-            '/context', '/model', 'set model to'
-        ]
-
-        # Task/request indicators
-        task_indicators = [
-            # Imperative verbs
-            'help', 'create', 'make', 'fix', 'add', 'update', 'change', 'modify',
-            'remove', 'delete', 'build', 'implement', 'write', 'read', 'show',
-            'display', 'check', 'test', 'review', 'analyze', 'debug', 'install',
-            'configure', 'setup', 'deploy', 'run', 'execute', 'search', 'find',
-            # Question words
-            'how', 'what', 'when', 'where', 'why', 'which', 'who',
-            'can you', 'could you', 'would you', 'will you',
-            # Request patterns
-            'i need', 'i want', 'i would like', 'please', 'let\'s'
-        ]
-
         for message in user_messages:
-            message_lower = message.lower()
-            message_start = message_lower[:100]  # Check first 100 chars for system patterns
-
             # Skip if message is too short
             if len(message) < 20:
                 continue
 
-            # Always skip system/automated messages (check beginning of message)
-            system_skip = [
-                'caveat:', '<command-name>', '<local-command-stdout>',
-                'the messages below were generated', 'context usage',
-                '/context', '/model', 'set model to'
-            ]
-            if any(pattern in message_start for pattern in system_skip):
+            message_lower = message.lower()
+
+            # Always skip system/automated messages (check first 100 chars for system patterns)
+            if _DESCRIPTION_SYSTEM_RE.search(message_lower, 0, 100):
                 continue
 
             # Skip if matches common skip patterns
-            if any(pattern in message_lower for pattern in skip_patterns):
-                # But only skip if the ENTIRE message is basically the skip pattern
-                # Allow messages like "ok, now let's create a function"
-                if len(message) < 50:  # Short message with skip pattern -> skip it
-                    continue
+            # But only skip if the ENTIRE message is basically the skip pattern
+            # Allow messages like "ok, now let's create a function"
+            if len(message) < 50 and _DESCRIPTION_SKIP_RE.search(message_lower):
+                continue
 
             # Accept if message is substantial (30+ chars) AND contains task indicators
             if len(message) >= 30:
-                if any(indicator in message_lower for indicator in task_indicators):
+                if _DESCRIPTION_TASK_RE.search(message_lower):
                     return message
                 # Also accept if it's long enough and doesn't match skip patterns
                 # (fallback for messages that are clearly tasks but don't match our patterns)
@@ -293,41 +793,91 @@ class SessionLoader:
 
         # Fallback: return first non-skip message if nothing matched
         for message in user_messages:
-            if len(message) >= 20:
-                message_lower = message.lower()
-                if not any(pattern in message_lower for pattern in skip_patterns):
-                    return message
+            if len(message) >= 20 and not _DESCRIPTION_SKIP_RE.search(message.lower()):
+                return message
 
         # Last resort: return first message if we have any
         return user_messages[0] if user_messages else None
 
     @staticmethod
-    def _extract_metadata(session_file: Path, workspace: str) -> SessionMetadata:
+    def _extract_metadata(session_file: Path, workspace: str,
+                          stat: Optional[os.stat_result] = None) -> SessionMetadata:
         """Extract metadata from a session file without loading full content."""
-        session_id = session_file.stem
-        stat = session_file.stat()
-
-        # Quick scan to get message count and basic info
-        message_count = 0
-        first_timestamp = None
-        last_timestamp = None
-        model = None
-        total_input = 0
-        total_output = 0
-        total_cache_read = 0
-        total_cache_create = 0
-        tool_usage = defaultdict(int)
-        cwd = None
-        user_messages = []  # Collect first 10 user messages for smart parsing
+        if stat is None:
+            stat = session_file.stat()
+        path = str(session_file)
+        entry = SessionLoader._scan_session(path, stat)
+        return SessionLoader._metadata_from_entry(entry, path, workspace, stat)
+
+    @staticmethod
+    def _scan_session(session_file: str, stat: os.stat_result,
+                      prior: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Scan a session file into a cache entry of running totals.
+
+        If `prior` is the entry from an earlier scan and the file has only been
+        appended to since, just the new bytes are read and folded into its totals.
+        """
+        resume = prior is not None and prior['size'] < stat.st_size and prior['offset'] <= stat.st_size
+        entry = {
+            'offset': 0,
+            'message_count': 0,
+            'first_timestamp': None,
+            'last_timestamp': None,
+            'model': None,
+            'total_input_tokens': 0,
+            'total_output_tokens': 0,
+            'total_cache_read_tokens': 0,
+            'total_cache_create_tokens': 0,
+            'tool_usage': {},
+            'cwd': None,
+            # First user messages for smart description parsing; None once complete
+            'user_messages': [],
+            'description': None,
+        }
 
         try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        data = json.loads(line)
-                        msg_type = data.get('type')
+            with open(session_file, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+                if resume and prior['offset']:
+                    # Only resume if the previous scan stopped at the end of a line
+                    f.seek(prior['offset'] - 1)
+                    if f.read(1) == b'\n':
+                        entry.update(prior)
+                    else:
+                        f.seek(0)
+
+                # Quick scan to get message count and basic info
+                message_count = entry['message_count']
+                first_timestamp = entry['first_timestamp']
+                last_timestamp = entry['last_timestamp']
+                model = entry['model']
+                total_input = entry['total_input_tokens']
+                total_output = entry['total_output_tokens']
+                total_cache_read = entry['total_cache_read_tokens']
+                total_cache_create = entry['total_cache_create_tokens']
+                tool_usage = defaultdict(int, entry['tool_usage'])
+                cwd = entry['cwd']
+                user_messages = entry['user_messages']
+                if user_messages is not None:
+                    user_messages = list(user_messages)
+                    sample_limit = SessionLoader.DESCRIPTION_SAMPLES
+                else:
+                    sample_limit = 0
+
+                try:
+                    for line in f:
+                        # Skip summaries, snapshots etc. without parsing them
+                        if not _MESSAGE_LINE_RE.search(line):
+                            continue
+
+                        try:
+                            data = _json_loads(line)
+                            msg_type = data.get('type')
+
+                            # The prefilter also matches nested messages; only top-level ones count
+                            if msg_type not in _MESSAGE_TYPES:
+                                continue
 
-                        if msg_type in ['user', 'assistant']:
                             message_count += 1
                             timestamp = data.get('timestamp')
 
@@ -336,70 +886,86 @@ class SessionLoader:
                                     first_timestamp = timestamp
                                 last_timestamp = timestamp
 
-                            # Collect first 10 user messages for smart description parsing
-                            if msg_type == 'user' and len(user_messages) < 10:
-                                message = data.get('message', {})
-                                content = message.get('content', '')
-                                msg_text = None
-                                if isinstance(content, str):
-                                    msg_text = content.strip()
-                                elif isinstance(content, list):
-                                    # Extract text from content blocks
-                                    for block in content:
-                                        if isinstance(block, dict) and block.get('type') == 'text':
-                                            msg_text = block.get('text', '').strip()
-                                            break
-                                        elif isinstance(block, str):
-                                            msg_text = block.strip()
-                                            break
-                                if msg_text:
-                                    user_messages.append(msg_text)
-
+                            # Assistant lines are the most common, so check them first
                             if msg_type == 'assistant':
-                                message = data.get('message', {})
+                                message = data.get('message', _EMPTY)
                                 if not model:
                                     model = message.get('model')
 
                                 # Accumulate token usage
-                                usage = message.get('usage', {})
+                                usage = message.get('usage', _EMPTY)
                                 total_input += usage.get('input_tokens', 0)
                                 total_output += usage.get('output_tokens', 0)
                                 total_cache_read += usage.get('cache_read_input_tokens', 0)
                                 total_cache_create += usage.get('cache_creation_input_tokens', 0)
 
-                                # Count tool usage
-                                content = message.get('content', [])
-                                if isinstance(content, list):
+                                # Count tool usage (names only; tool inputs are only
+                                # serialised by _format_content when a conversation is shown)
+                                content = message.get('content', ())
+                                if type(content) is list:
                                     for block in content:
-                                        if isinstance(block, dict) and block.get('type') == 'tool_use':
+                                        if type(block) is dict and block.get('type') == 'tool_use':
                                             tool_name = block.get('name', 'unknown')
                                             tool_usage[tool_name] += 1
-
-                        # Extract cwd from user messages
-                        if msg_type == 'user' and not cwd:
-                            cwd = data.get('cwd')
-
-                    except (json.JSONDecodeError, Exception):
-                        continue
+                            else:
+                                # Collect first 10 user messages for smart description parsing
+                                if sample_limit and len(user_messages) < sample_limit:
+                                    message = data.get('message', _EMPTY)
+                                    content = message.get('content', '')
+                                    msg_text = None
+                                    if type(content) is str:
+                                        msg_text = content.strip()
+                                    elif type(content) is list:
+                                        # Extract text from content blocks
+                                        for block in content:
+                                            if type(block) is dict and block.get('type') == 'text':
+                                                msg_text = block.get('text', '').strip()
+                                                break
+                                            elif type(block) is str:
+                                                msg_text = block.strip()
+                                                break
+                                    if msg_text:
+                                        user_messages.append(msg_text)
+
+                                # Extract cwd from user messages
+                                if not cwd:
+                                    cwd = data.get('cwd')
+
+                        except (json.JSONDecodeError, Exception):
+                            continue
+                finally:
+                    entry.update(
+                        offset=f.tell(),
+                        message_count=message_count,
+                        first_timestamp=first_timestamp,
+                        last_timestamp=last_timestamp,
+                        model=model,
+                        total_input_tokens=total_input,
+                        total_output_tokens=total_output,
+                        total_cache_read_tokens=total_cache_read,
+                        total_cache_create_tokens=total_cache_create,
+                        tool_usage=dict(tool_usage),
+                        cwd=cwd,
+                        user_messages=user_messages,
+                    )
         except Exception:
             pass
 
-        # Convert timestamps to datetime if available
-        first_dt = None
-        last_dt = None
-        if first_timestamp:
-            try:
-                first_dt = datetime.fromisoformat(first_timestamp.replace('Z', '+00:00'))
-            except:
-                pass
-        if last_timestamp:
-            try:
-                last_dt = datetime.fromisoformat(last_timestamp.replace('Z', '+00:00'))
-            except:
-                pass
+        user_messages = entry['user_messages']
+        if user_messages is not None:
+            entry['description'] = SessionLoader._build_description(user_messages, entry['cwd'])
+            # With all samples and the cwd known, the description can no longer change
+            if len(user_messages) >= SessionLoader.DESCRIPTION_SAMPLES and entry['cwd']:
+                entry['user_messages'] = None
+
+        entry['mtime_ns'] = stat.st_mtime_ns
+        entry['size'] = stat.st_size
+        return entry
 
+    @staticmethod
+    def _build_description(user_messages: List[str], cwd: Optional[str]) -> str:
+        """Build the `[directory] message` description shown in the session list."""
         # Smart description parsing: find first meaningful task/request message
-        description = None
         meaningful_message = SessionLoader._find_meaningful_message(user_messages)
 
         if meaningful_message:
@@ -414,47 +980,93 @@ class SessionLoader:
             if cwd:
                 # Get just the directory name (last part of path)
                 dir_name = Path(cwd).name
-                description = f"[{dir_name}] {message_part}"
-            else:
-                description = message_part
+                return f"[{dir_name}] {message_part}"
+            return message_part
         elif cwd:
             # Use working directory if no first message
-            description = f"[{cwd}]"
-        else:
-            description = "[Empty session]"
-
-        # Load custom tag from sidecar file if it exists
-        custom_tag = SessionLoader._load_custom_tag(session_file)
-
-        return SessionMetadata(
-            session_id=session_id,
-            workspace=workspace,
-            file_path=session_file,
-            modified=datetime.fromtimestamp(stat.st_mtime),
-            size_bytes=stat.st_size,
-            message_count=message_count,
-            first_message_time=first_dt,
-            last_message_time=last_dt,
-            model=model,
-            total_input_tokens=total_input,
-            total_output_tokens=total_output,
-            total_cache_read_tokens=total_cache_read,
-            total_cache_create_tokens=total_cache_create,
-            tool_usage=dict(tool_usage),
-            cwd=cwd,
-            description=description,
-            custom_tag=custom_tag
-        )
+            return f"[{cwd}]"
+        return "[Empty session]"
 
     @staticmethod
     def load_session_messages(session_file: Path, limit: Optional[int] = None) -> List[Message]:
-        """Load all messages from a session file."""
+        """Load all messages from a session file (or only the first `limit` messages)."""
+        messages = SessionLoader.iter_cached_session_messages(session_file)
+        try:
+            return list(islice(messages, limit or None))
+        finally:
+            messages.close()
+
+    @staticmethod
+    def iter_cached_session_messages(session_file: Path) -> Iterator[Message]:
+        """
+        Like iter_session_messages, but reuse the parsed messages of recently viewed sessions.
+
+        A conversation is only cached once it has been read to the end, and is
+        reparsed if the file's mtime or size has changed since.
+        """
+        key = str(session_file)
+        try:
+            stat = session_file.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            version = None
+
+        cache = SessionLoader._message_cache
+        with SessionLoader._message_cache_lock:
+            cached = cache.get(key)
+            if cached and cached[0] == version:
+                cache.move_to_end(key)
+            else:
+                cached = None
+        if cached:
+            yield from cached[1]
+            return
+
         messages = []
+        nbytes = 0
+        for message in SessionLoader.iter_session_messages(session_file):
+            messages.append(message)
+            nbytes += sys.getsizeof(message.content)
+            yield message
+
+        if version and nbytes <= SessionLoader.MESSAGE_CACHE_MAX_BYTES:
+            with SessionLoader._message_cache_lock:
+                old = cache.pop(key, None)
+                if old:
+                    SessionLoader._message_cache_bytes -= old[2]
+                cache[key] = (version, messages, nbytes)
+                SessionLoader._message_cache_bytes += nbytes
+
+                # Evict least recently viewed conversations until both bounds hold
+                while (len(cache) > SessionLoader.MESSAGE_CACHE_SIZE
+                       or SessionLoader._message_cache_bytes > SessionLoader.MESSAGE_CACHE_MAX_BYTES):
+                    _, evicted = cache.popitem(last=False)
+                    SessionLoader._message_cache_bytes -= evicted[2]
+
+    @staticmethod
+    def forget_session_messages(session_file: Path) -> None:
+        """Drop a session's parsed messages from the conversation cache (e.g. after deleting it)."""
+        with SessionLoader._message_cache_lock:
+            old = SessionLoader._message_cache.pop(str(session_file), None)
+            if old:
+                SessionLoader._message_cache_bytes -= old[2]
 
-        with open(session_file, 'r', encoding='utf-8') as f:
+    @staticmethod
+    def iter_session_messages(session_file: Path) -> Iterator[Message]:
+        """
+        Lazily yield the messages of a session file.
+
+        The file stays open until the generator is exhausted or closed, so callers
+        can render the first messages and hand the rest to a background worker.
+        """
+        with open(session_file, 'rb', buffering=_READ_BUFFER_SIZE) as f:
             for line_num, line in enumerate(f, 1):
+                # Skip summaries, snapshots etc. without parsing them
+                if not _MESSAGE_LINE_RE.search(line):
+                    continue
+
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     msg_type = data.get('type')
 
                     if msg_type == 'user':
@@ -464,14 +1076,14 @@ class SessionLoader:
                         git_branch = data.get('gitBranch')
                         claude_version = data.get('version')
 
-                        messages.append(Message(
+                        parsed = Message(
                             role='user',
                             content=content,
                             timestamp=timestamp,
                             line_num=line_num,
                             git_branch=git_branch,
                             claude_version=claude_version
-                        ))
+                        )
 
                     elif msg_type == 'assistant':
                         message = data.get('message', {})
@@ -488,7 +1100,7 @@ class SessionLoader:
                         if usage:
                             metadata['usage'] = usage
 
-                        messages.append(Message(
+                        parsed = Message(
                             role='assistant',
                             content=content,
                             timestamp=timestamp,
@@ -496,58 +1108,41 @@ class SessionLoader:
                             line_num=line_num,
                             git_branch=git_branch,
                             claude_version=claude_version
-                        ))
+                        )
 
-                    if limit and len(messages) >= limit:
-                        break
+                    else:
+                        continue
 
                 except (json.JSONDecodeError, Exception):
                     continue
 
-        return messages
+                yield parsed
 
     @staticmethod
     def _format_content(content: Any) -> str:
         """Format message content for display."""
-        if isinstance(content, str):
+        # Parsed JSON only contains plain dict/list/str, so exact type checks are safe
+        if type(content) is str:
             return content
-        elif isinstance(content, list):
+        elif type(content) is list:
+            # Most messages are a single text block, which needs no joining
+            if len(content) == 1:
+                block = content[0]
+                if type(block) is dict and block.get('type') == 'text':
+                    text = block.get('text', '')
+                    if type(text) is str:
+                        return text
+
             parts = []
             for block in content:
-                if isinstance(block, dict):
-                    block_type = block.get('type')
-
-                    if block_type == 'text':
-                        parts.append(block.get('text', ''))
-
-                    elif block_type == 'tool_use':
-                        tool_name = block.get('name', 'unknown')
-                        tool_input = json.dumps(block.get('input', {}), indent=2)
-                        parts.append(f"\n[Tool: {tool_name}]\n{tool_input}\n")
-
-                    elif block_type == 'tool_result':
-                        tool_id = block.get('tool_use_id', 'unknown')
-                        is_error = block.get('is_error', False)
-                        result = block.get('content', '')
-                        status = "ERROR" if is_error else "OK"
-                        if isinstance(result, str):
-                            # Truncate long results
-                            if len(result) > 1000:
-                                result = result[:1000] + f"\n... ({len(result)} chars total)"
-                            parts.append(f"\n[Tool Result {status}]\n{result}\n")
-
-                    elif block_type == 'thinking':
-                        thinking = block.get('thinking', '')
-                        if len(thinking) > 500:
-                            thinking = thinking[:500] + f"... ({len(thinking)} chars total)"
-                        parts.append(f"\n[Thinking]\n{thinking}\n")
-
-                    elif block_type == 'image':
-                        source = block.get('source', {})
-                        media_type = source.get('media_type', 'unknown')
-                        parts.append(f"\n[Image: {media_type}]\n")
-
-                elif isinstance(block, str):
+                if type(block) is dict:
+                    handler = _BLOCK_HANDLERS.get(block.get('type'))
+                    if handler:
+                        text = handler(block)
+                        if text is not None:
+                            parts.append(text)
+
+                elif type(block) is str:
                     parts.append(block)
 
             return '\n'.join(parts)
@@ -562,13 +1157,16 @@ class SessionLoader:
         """
         search_lower = search_term.lower()
         try:
-            with open(session_file, 'r', encoding='utf-8') as f:
+            with open(session_file, 'rb', buffering=_READ_BUFFER_SIZE) as f:
                 for line in f:
+                    # Skip summaries, snapshots and other non-message lines without parsing them
+                    if not _MESSAGE_LINE_RE.search(line):
+                        continue
                     try:
-                        data = json.loads(line)
+                        data = _json_loads(line)
                         msg_type = data.get('type')
 
-                        if msg_type in ['user', 'assistant']:
+                        if msg_type in _MESSAGE_TYPES:
                             message = data.get('message', {})
                             content = message.get('content', '')
 
@@ -625,13 +1223,82 @@ class SessionBrowser(Container):
         table.zebra_stripes = True
 
         # Add columns
-        table.add_column("Date", width=20)
-        table.add_column("Tag", width=25)  # Custom user-defined tag
-        table.add_column("Description", width=45)  # Auto-generated description
-        table.add_column("Workspace", width=25)
-        table.add_column("Messages", width=10)
-        table.add_column("Tokens", width=12)
-        table.add_column("Size", width=10)
+        table.add_column("Date", width=20, key="date")
+        table.add_column("Tag", width=25, key="tag")  # Custom user-defined tag
+        table.add_column("Description", width=45, key="description")  # Auto-generated description
+        table.add_column("Workspace", width=25, key="workspace")
+        table.add_column("Messages", width=10, key="messages")
+        table.add_column("Tokens", width=12, key="tokens")
+        table.add_column("Size", width=10, key="size")
+
+
+class _CachedHeightWrappedDocument(WrappedDocument):
+    """WrappedDocument that remembers its height until it is rewrapped."""
+
+    _height: Optional[int] = None
+
+    @property
+    def height(self) -> int:
+        if self._height is None:
+            self._height = super().height
+        return self._height
+
+    def wrap(self, width: int, tab_width: Optional[int] = None) -> None:
+        self._height = None
+        super().wrap(width, tab_width)
+
+    def wrap_range(self, *args, **kwargs) -> None:
+        self._height = None
+        super().wrap_range(*args, **kwargs)
+
+
+class ConversationLog(TextArea):
+    """
+    TextArea for conversation transcripts.
+
+    TextArea reads its full text and sums the height of every wrapped line for
+    each line it renders, so scrolling cost grew with the transcript length.
+    Both are cached here, so a redraw only depends on the lines on screen.
+    """
+
+    _text_cache: Optional[str] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache_wrapped_height()
+
+    def _cache_wrapped_height(self) -> None:
+        # Same object (the navigator shares it), just with the cached height property
+        if type(self.wrapped_document) is WrappedDocument:
+            self.wrapped_document.__class__ = _CachedHeightWrappedDocument
+
+    @property
+    def text(self) -> str:
+        """The entire text content of the document."""
+        if self._text_cache is None:
+            self._text_cache = self.document.text
+        return self._text_cache
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.load_text(value)
+
+    def load_text(self, text: str) -> None:
+        self._text_cache = None
+        super().load_text(text)
+        self._cache_wrapped_height()
+
+    def edit(self, edit: Edit) -> EditResult:
+        self._text_cache = None
+        return super().edit(edit)
+
+    def undo(self) -> None:
+        self._text_cache = None
+        super().undo()
+
+    def redo(self) -> None:
+        self._text_cache = None
+        super().redo()
 
 
 class SessionDetail(VerticalScroll):
@@ -651,11 +1318,16 @@ class SessionDetail(VerticalScroll):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.message_positions = []  # List of y-positions for each message separator
-        self.current_message_index = 0
+        self.message_positions = []  # Sorted line numbers of each message separator
         self.search_term = ""
         self.search_matches = []  # List of (line, col) positions
         self.current_match_index = -1
+        # Bumped whenever the conversation text is replaced or appended to
+        self.text_version = 0
+        # Offsets of the matches in the lowercased text
+        self._search_offsets: List[int] = []
+        # (text_version, lowercased text), reused by searches until the text changes
+        self._lower_text: Optional[Tuple[int, str]] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -664,22 +1336,19 @@ class SessionDetail(VerticalScroll):
         # Search input (hidden by default)
         yield Input(placeholder="Search in conversation...", id="conversation-search")
         # Use TextArea for selectable, copyable text
-        yield TextArea(id="conversation-log", read_only=True, show_line_numbers=False)
+        yield ConversationLog(id="conversation-log", read_only=True, show_line_numbers=False)
 
     def action_scroll_home(self) -> None:
         """Scroll to the top of the conversation."""
-        text_area = self.query_one("#conversation-log", TextArea)
+        text_area = self._conversation_log
         text_area.move_cursor((0, 0))
-        self.current_message_index = 0
 
     def action_scroll_end(self) -> None:
         """Scroll to the bottom of the conversation."""
-        text_area = self.query_one("#conversation-log", TextArea)
-        # Move to the last line
-        last_line = len(text_area.text.split('\n')) - 1
+        text_area = self._conversation_log
+        # Move to the last line (the document knows its line count; no need to split the text)
+        last_line = text_area.document.line_count - 1
         text_area.move_cursor((last_line, 0))
-        if self.message_positions:
-            self.current_message_index = len(self.message_positions) - 1
 
     def action_page_up(self) -> None:
         """Scroll up one page."""
@@ -691,43 +1360,40 @@ class SessionDetail(VerticalScroll):
 
     def action_prev_message(self) -> None:
         """Jump to the previous message."""
-        if not self.message_positions:
-            return
-
-        if self.current_message_index > 0:
-            self.current_message_index -= 1
-            # Get the TextArea and scroll it to the line number
-            text_area = self.query_one("#conversation-log", TextArea)
-            target_line = self.message_positions[self.current_message_index]
+        # Work from the cursor, so this also follows clicks, cursor keys and search jumps
+        text_area = self._conversation_log
+        index = bisect_left(self.message_positions, text_area.cursor_location[0]) - 1
+        if index >= 0:
             # Move cursor to the target line - this will scroll the view
-            text_area.move_cursor((target_line, 0))
+            text_area.move_cursor((self.message_positions[index], 0))
 
     def action_next_message(self) -> None:
         """Jump to the next message."""
-        if not self.message_positions:
-            return
-
-        if self.current_message_index < len(self.message_positions) - 1:
-            self.current_message_index += 1
-            # Get the TextArea and scroll it to the line number
-            text_area = self.query_one("#conversation-log", TextArea)
-            target_line = self.message_positions[self.current_message_index]
+        text_area = self._conversation_log
+        index = bisect_right(self.message_positions, text_area.cursor_location[0])
+        if index < len(self.message_positions):
             # Move cursor to the target line - this will scroll the view
-            text_area.move_cursor((target_line, 0))
+            text_area.move_cursor((self.message_positions[index], 0))
 
     def set_message_positions(self, positions: list):
-        """Set the message separator positions for navigation."""
+        """Set the message separator positions for navigation after the text was replaced."""
         self.message_positions = positions
-        self.current_message_index = 0
+        self.text_version += 1
+
+    def add_message_positions(self, positions: list):
+        """Add positions for messages appended to the conversation."""
+        self.message_positions.extend(positions)
+        self.text_version += 1
 
     def on_mount(self) -> None:
-        """Hide search input on mount."""
-        search_input = self.query_one("#conversation-search", Input)
-        search_input.display = False
+        """Cache the child widgets used by every key binding and hide the search input."""
+        self._conversation_log = self.query_one("#conversation-log", TextArea)
+        self._search_input = self.query_one("#conversation-search", Input)
+        self._search_input.display = False
 
     def action_start_search(self) -> None:
         """Show the search input."""
-        search_input = self.query_one("#conversation-search", Input)
+        search_input = self._search_input
         search_input.display = True
         search_input.value = ""
         search_input.focus()
@@ -738,16 +1404,16 @@ class SessionDetail(VerticalScroll):
             self.perform_search(event.value)
             # Hide search input and return focus to text area
             event.input.display = False
-            text_area = self.query_one("#conversation-log", TextArea)
+            text_area = self._conversation_log
             self.app.set_focus(text_area)
 
     def on_key(self, event) -> None:
         """Handle key events for search input."""
-        search_input = self.query_one("#conversation-search", Input)
+        search_input = self._search_input
         if search_input.display and event.key == "escape":
             # Cancel search and hide input
             search_input.display = False
-            text_area = self.query_one("#conversation-log", TextArea)
+            text_area = self._conversation_log
             self.app.set_focus(text_area)
             event.stop()
 
@@ -756,23 +1422,46 @@ class SessionDetail(VerticalScroll):
         if not search_term:
             return
 
+        previous_term = self.search_term
         self.search_term = search_term.lower()
         self.search_matches = []
         self.current_match_index = -1
 
-        text_area = self.query_one("#conversation-log", TextArea)
-        lines = text_area.text.split('\n')
-
-        # Find all matches
-        for line_num, line in enumerate(lines):
-            line_lower = line.lower()
-            col = 0
-            while True:
-                pos = line_lower.find(self.search_term, col)
-                if pos == -1:
-                    break
-                self.search_matches.append((line_num, pos))
-                col = pos + 1
+        # Lowercase once per version of the text and find() across all of it,
+        # instead of lowercasing and scanning every line on each search
+        lower_text = self._lower_text
+        if lower_text and lower_text[0] == self.text_version:
+            text = lower_text[1]
+        else:
+            text_area = self._conversation_log
+            text = text_area.text.lower()
+            self._lower_text = (self.text_version, text)
+            previous_term = ""
+
+        if previous_term and self.search_term.startswith(previous_term):
+            # A longer term can only match where the previous one did, so just recheck those
+            offsets = [pos for pos in self._search_offsets if text.startswith(self.search_term, pos)]
+        else:
+            pattern = _search_pattern(self.search_term)
+            if pattern:
+                offsets = [match.start() for match in pattern.finditer(text)]
+            else:
+                offsets = []
+                pos = text.find(self.search_term)
+                while pos != -1:
+                    offsets.append(pos)
+                    pos = text.find(self.search_term, pos + 1)
+        self._search_offsets = offsets
+
+        # Turn offsets into (line, col), counting the lines skipped since the previous match
+        line_num = 0
+        line_start = 0
+        for pos in offsets:
+            newline = text.rfind('\n', line_start, pos)
+            if newline != -1:
+                line_num += text.count('\n', line_start, newline + 1)
+                line_start = newline + 1
+            self.search_matches.append((line_num, pos - line_start))
 
         if self.search_matches:
             self.current_match_index = 0
@@ -787,7 +1476,7 @@ class SessionDetail(VerticalScroll):
             return
 
         line, col = self.search_matches[index]
-        text_area = self.query_one("#conversation-log", TextArea)
+        text_area = self._conversation_log
         text_area.move_cursor((line, col))
 
     def action_find_next(self) -> None:
@@ -817,6 +1506,8 @@ class SessionDetail(VerticalScroll):
         self.search_term = ""
         self.search_matches = []
         self.current_match_index = -1
+        self._search_offsets = []
+        self._lower_text = None
 
 
 class SessionAnalytics(Container):
@@ -963,15 +1654,35 @@ class SessionViewerApp(App):
 
     TITLE = "Claude Session Viewer"
 
-    def __init__(self, workspace: Optional[str] = None, custom_paths: Optional[List[Path]] = None):
+    # Messages rendered before switching to the background loader, and batch size after that
+    CONVERSATION_FIRST_BATCH = 50
+    CONVERSATION_BATCH = 200
+    # Session rows are added to the table a page at a time, as the cursor or scroll nears the end
+    TABLE_PAGE = 200
+    # Seconds of typing pause before the session list is re-filtered
+    SEARCH_DEBOUNCE = 0.12
+    # Session table column keys, in the order of _row_cells
+    TABLE_COLUMNS = ("date", "tag", "description", "workspace", "messages", "tokens", "size")
+
+    def __init__(self, workspace: Optional[str] = None, custom_paths: Optional[List[Path]] = None,
+                 limit: Optional[int] = None):
         """Initialize the app."""
         super().__init__()
         self.workspace_filter = workspace
         self.custom_paths = custom_paths
+        self.session_limit = limit
         self.sessions: List[SessionMetadata] = []
+        self._sessions_by_id: Dict[str, SessionMetadata] = {}
+        self._filtered_sessions: List[SessionMetadata] = []  # Current table contents, in order
+        self._table_rows_shown = 0  # How many of them have been added to the table
+        self._filter_timer: Optional[Timer] = None  # Pending debounced search
         self.selected_session: Optional[SessionMetadata] = None
         self.selected_for_delete: set = set()  # Track multi-selected sessions
         self.current_view = "list"  # 'list', 'detail', 'analytics'
+        self._conversation_generation = 0  # Bumped on every conversation load
+        self._sessions_generation = 0  # Bumped on every session list (re)load
+        self._refreshed_sessions: Optional[List[SessionMetadata]] = None  # Collected by a refresh
+        self._analytics_session: Optional[SessionMetadata] = None  # Session the analytics tab shows
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -991,26 +1702,190 @@ class SessionViewerApp(App):
 
     def on_mount(self) -> None:
         """Called when app starts."""
+        # Widgets used on every keystroke, scroll and batch; the layout never replaces them
+        self._table = self.query_one("#session-table", DataTable)
+        self._search_input = self.query_one("#search-input", Input)
+        self._conversation_log = self.query_one("#conversation-log", TextArea)
+        self._session_detail = self.query_one(SessionDetail)
+        self._tabbed = self.query_one(TabbedContent)
+
         self.load_sessions()
-        self.populate_table()
+        self.watch(self._table, "scroll_y", self._on_session_table_scroll, init=False)
         # Set focus to the session table so user can immediately navigate with arrow keys
-        self.set_focus(self.query_one("#session-table"))
+        self.set_focus(self._table)
+
+    def load_sessions(self, keep_table: bool = False) -> None:
+        """
+        Load all sessions from disk, adding them to the table as they're found.
+
+        With keep_table, the current rows stay up while sessions are rescanned and
+        are then updated in place where possible.
+        """
+        self._sessions_generation += 1
+        if keep_table:
+            self._refreshed_sessions = []
+            self._stream_sessions(self._sessions_generation)
+            return
 
-    def load_sessions(self) -> None:
-        """Load all sessions from disk."""
+        self._refreshed_sessions = None
+        self.sessions = []
+        self._sessions_by_id = {}
+        self._filtered_sessions = []
+        self._table_rows_shown = 0
+        self._table.clear()
+        self._stream_sessions(self._sessions_generation)
+
+    @work(thread=True, exclusive=True, group="sessions")
+    def _stream_sessions(self, generation: int) -> None:
+        """Scan sessions in a worker thread and hand them to the UI in batches."""
+        worker = get_current_worker()
+        batches = SessionLoader.iter_sessions(self.workspace_filter, self.custom_paths, self.session_limit)
         try:
-            self.sessions = SessionLoader.list_sessions(self.workspace_filter, self.custom_paths)
+            for batch in batches:
+                if worker.is_cancelled:
+                    return
+                self.call_from_thread(self._add_sessions, generation, batch)
         except Exception as e:
-            self.notify(f"Error loading sessions: {e}", severity="error")
-            self.sessions = []
+            self.call_from_thread(self.notify, f"Error loading sessions: {e}", severity="error")
+        finally:
+            batches.close()
+
+        if not worker.is_cancelled:
+            self.call_from_thread(self._finish_loading_sessions, generation)
+
+    def _add_sessions(self, generation: int, batch: List[SessionMetadata]) -> None:
+        """Add a batch of streamed sessions, skipping batches from a superseded load."""
+        if generation != self._sessions_generation:
+            return
+        if self._refreshed_sessions is not None:
+            self._refreshed_sessions.extend(batch)
+            return
+
+        batch.sort(key=attrgetter('modified_ts'), reverse=True)
+        self.sessions.extend(batch)
+        for session in batch:
+            self._sessions_by_id.setdefault(session.session_id, session)
+
+        # Deep search reads every file, so it runs once the full list is loaded
+        filter_text = self._search_input.value
+        if not filter_text.startswith("//"):
+            # Show new rows right away only while the table isn't holding rows back already
+            all_shown = self._table_rows_shown == len(self._filtered_sessions)
+            self._filtered_sessions.extend(self._filter_sessions(batch, filter_text))
+            if all_shown:
+                self._show_table_rows(self.TABLE_PAGE)
+
+    def _finish_loading_sessions(self, generation: int) -> None:
+        """Put the streamed sessions in display order once loading completes."""
+        if generation != self._sessions_generation:
+            return
+        if self._refreshed_sessions is not None:
+            sessions, self._refreshed_sessions = self._refreshed_sessions, None
+            self._apply_refreshed_sessions(sessions)
+            return
+
+        sessions = self.sessions
+        filter_text = self._search_input.value
+        in_order = all(a.modified_ts >= b.modified_ts for a, b in zip(sessions, islice(sessions, 1, None)))
+        if in_order and not filter_text.startswith("//"):
+            return
+
+        # Batches arrive in scan order; redraw sorted, keeping the highlighted row
+        sessions.sort(key=attrgetter('modified_ts'), reverse=True)
+        # Reversed so the first session wins if an ID appears in several workspaces
+        self._sessions_by_id = {s.session_id: s for s in reversed(sessions)}
+        self._repopulate_keeping_cursor(filter_text)
+
+    def _apply_refreshed_sessions(self, sessions: List[SessionMetadata]) -> None:
+        """Swap in a rescanned session list, updating only the changed cells if the row order held."""
+        sessions.sort(key=attrgetter('modified_ts'), reverse=True)
+        filter_text = self._search_input.value
+        shown = self._filtered_sessions[:self._table_rows_shown]
+        all_shown = self._table_rows_shown == len(self._filtered_sessions)
+
+        self.sessions = sessions
+        # Reversed so the first session wins if an ID appears in several workspaces
+        self._sessions_by_id = {s.session_id: s for s in reversed(sessions)}
+
+        if filter_text.startswith("//"):
+            self._repopulate_keeping_cursor(filter_text)
+            return
+
+        filtered = self._filter_sessions(sessions, filter_text)
+        if [s.session_id for s in filtered[:len(shown)]] != [s.session_id for s in shown]:
+            self._repopulate_keeping_cursor(filter_text)
+            return
+
+        table = self._table
+        for old, new in zip(shown, filtered):
+            old_cells = self._row_cells(old)
+            new_cells = self._row_cells(new)
+            if old_cells != new_cells:
+                for column, old_cell, new_cell in zip(self.TABLE_COLUMNS, old_cells, new_cells):
+                    if old_cell != new_cell:
+                        table.update_cell(new.session_id, column, new_cell)
+
+        self._filtered_sessions = filtered
+        # Sessions that appeared after the last row show up if nothing was held back
+        if all_shown:
+            self._show_table_rows(self.TABLE_PAGE)
+
+    def _repopulate_keeping_cursor(self, filter_text: str) -> None:
+        """Rebuild the table for filter_text, keeping the highlighted session under the cursor."""
+        table = self._table
+        try:
+            highlighted = table.ordered_rows[table.cursor_row].key.value
+        except Exception:
+            highlighted = None
+        self.populate_table(filter_text)
+        if highlighted is not None:
+            for row, session in enumerate(self._filtered_sessions):
+                if session.session_id == highlighted:
+                    self._show_table_rows_through(row)
+                    table.move_cursor(row=row)
+                    break
 
     def populate_table(self, filter_text: str = "", deep_search: bool = False) -> None:
         """Populate the sessions table."""
-        table = self.query_one("#session-table", DataTable)
-        table.clear()
+        # Callers pass the current search text, so a pending debounced refilter is redundant
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._filter_timer = None
 
-        # Filter out empty sessions and apply search filter
-        filtered = [s for s in self.sessions if s.message_count > 0]
+        table = self._table
+        table.clear()
+        self._filtered_sessions = self._filter_sessions(self.sessions, filter_text, deep_search)
+        self._table_rows_shown = 0
+        self._show_table_rows(self.TABLE_PAGE)
+
+    def _show_table_rows(self, count: int) -> None:
+        """Add up to `count` more of the filtered sessions to the table."""
+        start = self._table_rows_shown
+        sessions = self._filtered_sessions[start:start + count]
+        if sessions:
+            self._add_session_rows(self._table, sessions)
+            self._table_rows_shown = start + len(sessions)
+
+    def _show_table_rows_through(self, row: int) -> None:
+        """Make sure the table has added rows up to and including `row`."""
+        if row >= self._table_rows_shown:
+            self._show_table_rows(row + 1 - self._table_rows_shown)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Add the next page of rows when the cursor gets close to the last one."""
+        if event.data_table.id == "session-table" and event.cursor_row >= self._table_rows_shown - self.TABLE_PAGE // 4:
+            self._show_table_rows(self.TABLE_PAGE)
+
+    def _on_session_table_scroll(self) -> None:
+        """Add the next page of rows when scrolling gets close to the bottom."""
+        table = self._table
+        if table.max_scroll_y - table.scroll_y < self.TABLE_PAGE // 4:
+            self._show_table_rows(self.TABLE_PAGE)
+
+    def _filter_sessions(self, sessions: List[SessionMetadata], filter_text: str,
+                         deep_search: bool = False) -> List[SessionMetadata]:
+        """Filter out empty sessions and apply the search filter."""
+        filtered = [s for s in sessions if s.message_count > 0]
 
         if filter_text:
             # Check for deep search prefix
@@ -1030,11 +1905,7 @@ class SessionViewerApp(App):
                     deep_results = []
                     for s in filtered:
                         # First check quick fields
-                        if (filter_lower in s.session_id.lower()
-                            or filter_lower in s.workspace.lower()
-                            or (s.description and filter_lower in s.description.lower())
-                            or (s.custom_tag and filter_lower in s.custom_tag.lower())
-                            or (s.cwd and filter_lower in s.cwd.lower())):
+                        if filter_lower in s.search_blob:
                             deep_results.append(s)
                         # Then do deep content search
                         elif SessionLoader.search_session_content(s.file_path, filter_text):
@@ -1042,43 +1913,64 @@ class SessionViewerApp(App):
                     filtered = deep_results
                     self.notify(f"Found {len(filtered)} sessions", severity="information")
                 else:
-                    # Quick search: only search metadata fields
-                    filtered = [
-                        s for s in filtered
-                        if filter_lower in s.session_id.lower()
-                        or filter_lower in s.workspace.lower()
-                        or (s.description and filter_lower in s.description.lower())
-                        or (s.custom_tag and filter_lower in s.custom_tag.lower())
-                        or (s.cwd and filter_lower in s.cwd.lower())
-                    ]
-
-        # Add rows
-        for session in filtered:
-            date_str = session.modified.strftime("%Y-%m-%d %H:%M:%S")
-            tokens_str = f"{session.total_input_tokens + session.total_output_tokens:,}"
-            size_str = f"{session.size_bytes / 1024 / 1024:.1f} MB"
-
-            # Custom tag (user-defined)
-            tag = session.custom_tag or ""
-
-            # Auto-generated description with selection indicator
-            description = session.description or "[No description]"
-            if session.session_id in self.selected_for_delete:
-                description = f"[✓] {description}"
-
-            table.add_row(
-                date_str,
-                tag,
-                description,
-                session.workspace,
-                str(session.message_count),
-                tokens_str,
-                size_str,
-                key=session.session_id
-            )
+                    # Quick search: only search metadata fields, matching every word
+                    tokens = filter_lower.split()
+                    if len(tokens) == 1:
+                        token = tokens[0]
+                        filtered = [s for s in filtered if token in s.search_blob]
+                    else:
+                        filtered = [s for s in filtered if all(t in s.search_blob for t in tokens)]
+
+        return filtered
+
+    def _add_session_rows(self, table: DataTable, sessions: List[SessionMetadata]) -> None:
+        """Append a row to the sessions table for each session."""
+        for session in sessions:
+            table.add_row(*self._row_cells(session), key=session.session_id)
+
+    def _row_cells(self, session: SessionMetadata) -> Tuple[str, ...]:
+        """Cell values of a session's table row, in TABLE_COLUMNS order."""
+        date_str, tokens_str, size_str, messages_str = session.display_strings()
+        return (
+            date_str,
+            session.custom_tag or "",  # Custom tag (user-defined)
+            self._description_cell(session),
+            session.workspace,
+            messages_str,
+            tokens_str,
+            size_str,
+        )
+
+    def _description_cell(self, session: SessionMetadata) -> str:
+        """Auto-generated description with the multi-delete selection indicator."""
+        description = session.description or "[No description]"
+        # The selection is usually empty, so skip hashing the id for every row
+        if self.selected_for_delete and session.session_id in self.selected_for_delete:
+            description = f"[✓] {description}"
+        return description
+
+    def _update_description_cell(self, table: DataTable, session_id: str) -> None:
+        """Redraw the description cell of one session's row, if it is in the table."""
+        session = self._sessions_by_id.get(session_id)
+        if session is None:
+            return
+        try:
+            table.update_cell(session_id, "description", self._description_cell(session))
+        except Exception:
+            # Row not added to the table (filtered out or not paged in yet)
+            pass
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
+        if event.input.id == "search-input":
+            # Re-filter once typing pauses instead of on every keystroke
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            value = event.value
+            self._filter_timer = self.set_timer(self.SEARCH_DEBOUNCE, lambda: self.populate_table(value))
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Apply the session search immediately when Enter is pressed."""
         if event.input.id == "search-input":
             self.populate_table(event.value)
 
@@ -1088,10 +1980,7 @@ class SessionViewerApp(App):
             return
 
         session_id = event.row_key.value
-        self.selected_session = next(
-            (s for s in self.sessions if s.session_id == session_id),
-            None
-        )
+        self.selected_session = self._sessions_by_id.get(session_id)
 
         if not self.selected_session:
             self.notify("Session not found", severity="error")
@@ -1104,37 +1993,18 @@ class SessionViewerApp(App):
         # Defer tab switch and conversation loading until after event completes
         # This prevents race conditions with Textual's event processing
         def switch_and_load():
-            tabbed = self.query_one(TabbedContent)
+            tabbed = self._tabbed
             tabbed.active = "detail"
 
-            # Show loading message in the text area before starting the actual load
-            if self.selected_session.message_count > 50:
-                text_area = self.query_one("#conversation-log", TextArea)
-                text_area.text = f"Loading conversation...\n{self.selected_session.message_count} messages"
-
-            # Defer the actual conversation loading to let the loading message display
-            def do_load():
-                self.load_conversation()
-                self.load_analytics()
-
-                # Set focus to the conversation log
-                try:
-                    text_area = self.query_one("#conversation-log", TextArea)
-                    self.set_focus(text_area)
-                except Exception:
-                    pass
-
-            # For large conversations, defer the load to show loading message first
-            if self.selected_session.message_count > 50:
-                self.call_after_refresh(do_load)
-            else:
-                do_load()
+            # Messages are parsed by a worker, so this returns right away
+            self.load_conversation()
+            self.load_analytics()
 
         self.call_after_refresh(switch_and_load)
 
     def action_toggle_selection(self) -> None:
         """Toggle selection of the current session for multi-delete."""
-        table = self.query_one("#session-table", DataTable)
+        table = self._table
 
         # Get the currently highlighted row (cursor position)
         if table.cursor_row is None or table.cursor_row < 0:
@@ -1154,17 +2024,8 @@ class SessionViewerApp(App):
         else:
             self.selected_for_delete.add(session_id)
 
-        # Refresh table to show selection indicators, keeping cursor position
-        search_input = self.query_one("#search-input", Input)
-        current_row_index = table.cursor_coordinate.row
-        self.populate_table(search_input.value)
-
-        # Move cursor back to the same position
-        try:
-            table.move_cursor(row=current_row_index)
-        except Exception:
-            # If row not found (filtered out), just stay at current position
-            pass
+        # Update just this row's selection indicator
+        self._update_description_cell(table, session_id)
 
         count = len(self.selected_for_delete)
         if count > 0:
@@ -1176,11 +2037,11 @@ class SessionViewerApp(App):
         """View the selected session in detail."""
         # Only handle if we're on the browser tab
         # The RowSelected event already handles the tab switch
-        tabbed = self.query_one(TabbedContent)
+        tabbed = self._tabbed
         if tabbed.active != "browser":
             return
 
-        table = self.query_one("#session-table", DataTable)
+        table = self._table
 
         # Get the currently highlighted row (cursor position)
         if table.cursor_row is None or table.cursor_row < 0:
@@ -1195,10 +2056,7 @@ class SessionViewerApp(App):
             self.notify(f"Could not get session: {e}", severity="error")
             return
 
-        self.selected_session = next(
-            (s for s in self.sessions if s.session_id == session_id),
-            None
-        )
+        self.selected_session = self._sessions_by_id.get(session_id)
 
         if not self.selected_session:
             self.notify("Session not found", severity="error")
@@ -1218,7 +2076,7 @@ class SessionViewerApp(App):
         if not self.selected_session:
             return
 
-        text_area = self.query_one("#conversation-log", TextArea)
+        text_area = self._conversation_log
         tag_label = self.query_one("#conversation-tag", Label)
 
         # Update tag label
@@ -1228,25 +2086,11 @@ class SessionViewerApp(App):
         else:
             tag_label.display = False
 
-        # Helper function to format timestamp from UTC to local time
-        def format_timestamp(ts_str: Optional[str]) -> str:
-            if not ts_str:
-                return ""
-            try:
-                # Parse ISO format timestamp (UTC)
-                from datetime import timezone
-                if ts_str.endswith('Z'):
-                    ts_str = ts_str[:-1] + '+00:00'
-                utc_dt = datetime.fromisoformat(ts_str)
-                # Convert to local time
-                local_dt = utc_dt.replace(tzinfo=timezone.utc).astimezone()
-                return local_dt.strftime("%Y-%m-%d %H:%M:%S")
-            except Exception:
-                return ts_str
+        # Any batches still arriving for a previously shown conversation are stale
+        self._conversation_generation += 1
 
-        # Build the conversation as plain text
+        # Build the conversation header as plain text
         lines = []
-        message_positions = []  # Track line numbers where messages start
 
         lines.append(f"Session: {self.selected_session.session_id}")
         lines.append(f"Workspace: {self.selected_session.workspace}")
@@ -1254,92 +2098,165 @@ class SessionViewerApp(App):
         if self.selected_session.cwd:
             lines.append(f"Directory: {self.selected_session.cwd}")
         lines.append("")
-        lines.append("=" * 80)
+        lines.append(_SEPARATOR)
         lines.append("")
 
-        # Load messages
+        # Show the header while the messages are parsed in a worker
+        text_area.text = '\n'.join(lines + ["Loading conversation..."])
+        self._session_detail.set_message_positions([])
+
+        # Set focus to the text area so navigation keys work immediately
+        self.set_focus(text_area)
+
+        self._load_conversation_messages(
+            self.selected_session.file_path, self._conversation_generation, lines
+        )
+
+    @staticmethod
+    def _format_timestamp(ts_str: Optional[str]) -> str:
+        """Format a message timestamp from UTC to local time."""
+        if not ts_str:
+            return ""
         try:
-            messages = SessionLoader.load_session_messages(
-                self.selected_session.file_path
-            )
+            # Parse ISO format timestamp (UTC)
+            utc_dt = _parse_ts(ts_str)
+            # Convert to local time
+            local_dt = utc_dt.replace(tzinfo=timezone.utc).astimezone()
+            return _format_datetime(local_dt)
+        except Exception:
+            return ts_str
 
-            # Track git branch to show when it changes
-            current_git_branch = None
-
-            for i, msg in enumerate(messages, 1):
-                # Show git branch if it changed
-                if msg.git_branch and msg.git_branch != current_git_branch:
-                    current_git_branch = msg.git_branch
-                    lines.append(f"[Git Branch: {current_git_branch}]")
-                    lines.append("")
-
-                # Format timestamp
-                timestamp_str = format_timestamp(msg.timestamp)
-                time_suffix = f" - {timestamp_str}" if timestamp_str else ""
-
-                if msg.role == 'user':
-                    lines.append("")
-                    lines.append("=" * 80)
-                    lines.append(f"USER (Message {i}){time_suffix}:")
-                    # Record the position of the USER line we just added
-                    message_positions.append(len(lines) - 1)
-                    lines.append("=" * 80)
-                    lines.append(msg.content)
-
-                elif msg.role == 'assistant':
-                    lines.append("")
-                    lines.append("=" * 80)
-                    lines.append(f"ASSISTANT (Message {i}){time_suffix}:")
-                    # Record the position of the ASSISTANT line we just added
-                    message_positions.append(len(lines) - 1)
-
-                    # Show metadata
-                    if msg.metadata:
-                        meta_parts = []
-                        if msg.metadata.get('model'):
-                            meta_parts.append(f"Model: {msg.metadata['model']}")
-                        if msg.metadata.get('stop_reason'):
-                            meta_parts.append(f"Stop: {msg.metadata['stop_reason']}")
-                        if msg.metadata.get('usage'):
-                            usage = msg.metadata['usage']
-                            tokens = f"Tokens: in={usage.get('input_tokens', 0)}, out={usage.get('output_tokens', 0)}"
-                            if usage.get('cache_read_input_tokens'):
-                                tokens += f", cache_read={usage['cache_read_input_tokens']}"
-                            meta_parts.append(tokens)
-
-                        if meta_parts:
-                            lines.append(f"{' | '.join(meta_parts)}")
-
-                    lines.append(f"{'=' * 80}")
-                    lines.append(msg.content)
+    @staticmethod
+    def _format_messages(messages: List[Message], first_number: int, first_line: int,
+                         git_branch: Optional[str]) -> Tuple[List[str], List[int], Optional[str]]:
+        """
+        Format messages as conversation text lines.
 
-                lines.append("")
+        Returns the lines, the line numbers of each message header (counting from
+        first_line) and the git branch in effect after the last message.
+        """
+        lines = []
+        message_positions = []  # Track line numbers where messages start
 
-            # Set the text content (this is selectable and copyable)
-            text_area.text = '\n'.join(lines)
+        for i, msg in enumerate(messages, first_number):
+            # Show git branch if it changed
+            if msg.git_branch and msg.git_branch != git_branch:
+                git_branch = msg.git_branch
+                lines.extend((f"[Git Branch: {git_branch}]", ""))
 
-            # Set message positions for navigation
-            session_detail = self.query_one(SessionDetail)
-            session_detail.set_message_positions(message_positions)
+            # Format timestamp
+            timestamp_str = SessionViewerApp._format_timestamp(msg.timestamp)
+            time_suffix = f" - {timestamp_str}" if timestamp_str else ""
 
-            # Set focus to the text area so navigation keys work immediately
-            self.set_focus(text_area)
+            if msg.role == 'user':
+                # Record the position of the USER line
+                message_positions.append(first_line + len(lines) + 2)
+                lines.extend(("", _SEPARATOR, f"USER (Message {i}){time_suffix}:",
+                              _SEPARATOR, msg.content, ""))
+
+            elif msg.role == 'assistant':
+                # Record the position of the ASSISTANT line
+                message_positions.append(first_line + len(lines) + 2)
+                lines.extend(("", _SEPARATOR, f"ASSISTANT (Message {i}){time_suffix}:"))
+
+                # Show metadata
+                meta_line = msg.meta_line
+                if meta_line:
+                    lines.append(meta_line)
+
+                lines.extend((_SEPARATOR, msg.content, ""))
+
+            else:
+                lines.append("")
 
-            # Show completion notification for large conversations
-            if self.selected_session.message_count > 50:
-                self.notify(f"Loaded {len(messages)} messages", severity="information")
+        return lines, message_positions, git_branch
 
+    @work(thread=True, exclusive=True, group="conversation")
+    def _load_conversation_messages(self, session_file: Path, generation: int,
+                                    header_lines: List[str]) -> None:
+        """Parse a conversation in a thread, showing the first batch and then appending the rest."""
+        worker = get_current_worker()
+        messages = SessionLoader.iter_cached_session_messages(session_file)
+        shown = False
+        try:
+            # The first batch is small so the conversation appears quickly
+            batch = list(islice(messages, self.CONVERSATION_FIRST_BATCH))
+            batch_lines, positions, git_branch = self._format_messages(
+                batch, 1, len(header_lines), None
+            )
+            if worker.is_cancelled:
+                return
+            self.call_from_thread(
+                self._show_conversation, generation, header_lines + batch_lines, positions
+            )
+            shown = True
+            next_number = len(batch) + 1
+            line_count = len(header_lines) + len(batch_lines)
+            if len(batch) < self.CONVERSATION_FIRST_BATCH:
+                return
+
+            while not worker.is_cancelled:
+                batch = list(islice(messages, self.CONVERSATION_BATCH))
+                if not batch:
+                    break
+                batch_lines, positions, git_branch = self._format_messages(
+                    batch, next_number, line_count, git_branch
+                )
+                next_number += len(batch)
+                line_count += len(batch_lines)
+                self.call_from_thread(self._append_conversation, generation, batch_lines, positions)
         except Exception as e:
-            text_area.text = f"Error loading conversation: {e}"
+            if worker.is_cancelled:
+                return
+            if shown:
+                self.call_from_thread(self.notify, f"Error loading conversation: {e}", severity="error")
+            else:
+                self.call_from_thread(self._show_conversation, generation, [f"Error loading conversation: {e}"], [])
+            return
+        finally:
+            messages.close()
+
+        # Show completion notification for large conversations
+        if not worker.is_cancelled:
+            self.call_from_thread(self.notify, f"Loaded {next_number - 1} messages", severity="information")
+
+    def _show_conversation(self, generation: int, lines: List[str], message_positions: List[int]) -> None:
+        """Replace the conversation view with the header and first batch of messages."""
+        if generation != self._conversation_generation:
+            return
+
+        # Set the text content (this is selectable and copyable)
+        text_area = self._conversation_log
+        text_area.text = '\n'.join(lines)
+
+        # Set message positions for navigation
+        self._session_detail.set_message_positions(message_positions)
+
+    def _append_conversation(self, generation: int, lines: List[str], message_positions: List[int]) -> None:
+        """Append a batch of formatted lines to the conversation view."""
+        if generation != self._conversation_generation:
+            return
+
+        text_area = self._conversation_log
+        text_area.insert('\n' + '\n'.join(lines), text_area.document.end)
+        # Streamed batches are not user edits, so don't keep them in the undo history
+        text_area.history.clear()
+
+        session_detail = self._session_detail
+        session_detail.add_message_positions(message_positions)
 
     def load_analytics(self) -> None:
         """Load and display analytics for the selected session."""
         if not self.selected_session:
             return
 
-        container = self.query_one("#analytics-content", Static)
-
+        # Reopening the same session needs no re-render; a reload creates new session objects
         s = self.selected_session
+        if s is self._analytics_session:
+            return
+        self._analytics_session = s
+
+        container = self.query_one("#analytics-content", Static)
 
         # Build analytics text
         lines = []
@@ -1374,8 +2291,8 @@ class SessionViewerApp(App):
         if s.first_message_time and s.last_message_time:
             duration = s.last_message_time - s.first_message_time
             lines.append("[bold]Timeline[/bold]")
-            lines.append(f"  First Message: {s.first_message_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            lines.append(f"  Last Message: {s.last_message_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"  First Message: {_format_datetime(s.first_message_time)}")
+            lines.append(f"  Last Message: {_format_datetime(s.last_message_time)}")
             lines.append(f"  Duration: {duration}")
 
         container.update("\n".join(lines))
@@ -1384,14 +2301,14 @@ class SessionViewerApp(App):
         """Resume session in a new Windows Terminal window."""
         # First determine which session to resume
         # Check if we're viewing a session in detail view, otherwise use table cursor
-        tabbed = self.query_one(TabbedContent)
+        tabbed = self._tabbed
 
         if tabbed.active == "detail" and self.selected_session:
             # Resume the currently viewed session
             session = self.selected_session
         else:
             # Resume from table cursor position
-            table = self.query_one("#session-table", DataTable)
+            table = self._table
 
             # Get the currently highlighted row (cursor position)
             if table.cursor_row is None or table.cursor_row < 0:
@@ -1406,10 +2323,7 @@ class SessionViewerApp(App):
                 self.notify(f"Could not get session: {e}", severity="error")
                 return
 
-            session = next(
-                (s for s in self.sessions if s.session_id == session_id),
-                None
-            )
+            session = self._sessions_by_id.get(session_id)
 
             if not session:
                 self.notify("Session not found", severity="error")
@@ -1451,7 +2365,7 @@ class SessionViewerApp(App):
             ]
         else:
             # Delete only the currently highlighted session
-            table = self.query_one("#session-table", DataTable)
+            table = self._table
 
             if table.cursor_row is None or table.cursor_row < 0:
                 self.notify("No session highlighted", severity="warning")
@@ -1465,10 +2379,7 @@ class SessionViewerApp(App):
                 self.notify(f"Could not get session: {e}", severity="error")
                 return
 
-            current_session = next(
-                (s for s in self.sessions if s.session_id == session_id),
-                None
-            )
+            current_session = self._sessions_by_id.get(session_id)
 
             if not current_session:
                 self.notify("Session not found", severity="error")
@@ -1500,6 +2411,7 @@ class SessionViewerApp(App):
                     for session in sessions_to_delete:
                         try:
                             session.file_path.unlink()
+                            SessionLoader.forget_session_messages(session.file_path)
                             deleted_count += 1
                         except Exception as e:
                             errors.append(f"{session.session_id[:8]}: {str(e)}")
@@ -1514,17 +2426,23 @@ class SessionViewerApp(App):
                             error_msg += f"\n...and {len(errors) - 3} more"
                         self.notify(f"Errors:\n{error_msg}", severity="error")
 
-                    # Reload sessions
-                    self.load_sessions()
-                    search_input = self.query_one("#search-input", Input)
-                    self.populate_table(search_input.value)
+                    # Drop the deleted sessions from the table instead of reloading
+                    deleted_ids = {
+                        s.session_id for s in sessions_to_delete
+                        if not s.file_path.exists()
+                    }
+                    self._remove_sessions(deleted_ids)
 
-                    # Clear selections
+                    # Clear selections, unmarking any sessions that could not be deleted
                     self.selected_session = None
+                    still_marked = self.selected_for_delete - deleted_ids
                     self.selected_for_delete.clear()
+                    table = self._table
+                    for session_id in still_marked:
+                        self._update_description_cell(table, session_id)
 
                     # Go back to list
-                    tabbed = self.query_one(TabbedContent)
+                    tabbed = self._tabbed
                     tabbed.active = "browser"
 
                 except Exception as e:
@@ -1552,42 +2470,57 @@ class SessionViewerApp(App):
 
         self.push_screen(ConfirmDeleteScreen(), confirm_delete)
 
+    def _remove_sessions(self, session_ids: set) -> None:
+        """Remove sessions from the loaded list and their rows from the table."""
+        if not session_ids:
+            return
+        table = self._table
+
+        shown = self._filtered_sessions[:self._table_rows_shown]
+        for session in shown:
+            if session.session_id in session_ids:
+                table.remove_row(session.session_id)
+                self._table_rows_shown -= 1
+
+        self.sessions = [s for s in self.sessions if s.session_id not in session_ids]
+        self._filtered_sessions = [s for s in self._filtered_sessions if s.session_id not in session_ids]
+        for session_id in session_ids:
+            self._sessions_by_id.pop(session_id, None)
+
     def check_action_back_to_list(self) -> bool:
         """Check if back to list action should be enabled (only when not on browser tab)."""
         try:
-            tabbed = self.query_one(TabbedContent)
+            tabbed = self._tabbed
             return tabbed.active != "browser"
         except:
             return False
 
     def action_back_to_list(self) -> None:
         """Go back to the session list."""
-        tabbed = self.query_one(TabbedContent)
+        tabbed = self._tabbed
         # Only switch if not already on browser tab
         if tabbed.active == "browser":
             return
         tabbed.active = "browser"
         # Set focus back to session table for immediate navigation
-        self.set_focus(self.query_one("#session-table"))
+        self.set_focus(self._table)
 
     def check_action_refresh(self) -> bool:
         """Check if refresh action should be enabled (only on browser tab)."""
         try:
-            tabbed = self.query_one(TabbedContent)
+            tabbed = self._tabbed
             return tabbed.active == "browser"
         except:
             return False
 
     def action_refresh(self) -> None:
         """Refresh the session list."""
-        self.load_sessions()
-        search_input = self.query_one("#search-input", Input)
-        self.populate_table(search_input.value)
+        self.load_sessions(keep_table=True)
         self.notify("Sessions refreshed", severity="information")
 
     def action_edit_tag(self) -> None:
         """Edit the custom tag for the highlighted session."""
-        table = self.query_one("#session-table", DataTable)
+        table = self._table
 
         # Get the currently highlighted row
         if table.cursor_row is None or table.cursor_row < 0:
@@ -1602,10 +2535,7 @@ class SessionViewerApp(App):
             self.notify(f"Could not get session: {e}", severity="error")
             return
 
-        session = next(
-            (s for s in self.sessions if s.session_id == session_id),
-            None
-        )
+        session = self._sessions_by_id.get(session_id)
 
         if not session:
             self.notify("Session not found", severity="error")
@@ -1663,11 +2593,12 @@ class SessionViewerApp(App):
                         pass
 
                 # Refresh the table
-                search_input = self.query_one("#search-input", Input)
+                search_input = self._search_input
                 current_row_index = table.cursor_coordinate.row
                 self.populate_table(search_input.value)
                 # Restore cursor position
                 try:
+                    self._show_table_rows_through(current_row_index)
                     table.move_cursor(row=current_row_index)
                 except Exception:
                     pass
@@ -1749,6 +2680,7 @@ Examples:
   python claude-session-tui.py --workspace NAME    # Show sessions from specific workspace
   python claude-session-tui.py --path /custom/dir  # Scan custom directory for sessions
   python claude-session-tui.py --path /dir1 --path /dir2  # Scan multiple directories
+  python claude-session-tui.py --limit 200         # Only load the 200 most recent sessions
 
 Keyboard Shortcuts:
   Enter       - View session details
@@ -1764,10 +2696,12 @@ Keyboard Shortcuts:
     parser.add_argument('--workspace', '-w', help='Filter to specific workspace')
     parser.add_argument('--path', '-p', action='append', type=Path,
                         help='Custom path(s) to scan for .jsonl session files (can be specified multiple times)')
+    parser.add_argument('--limit', '-n', type=int,
+                        help='Only load the N most recently modified sessions')
     args = parser.parse_args()
 
     # Run the app
-    app = SessionViewerApp(workspace=args.workspace, custom_paths=args.path)
+    app = SessionViewerApp(workspace=args.workspace, custom_paths=args.path, limit=args.limit)
     app.run()
 
 
@@ -14,6 +14,15 @@ import os
 from pathlib import Path
 from datetime import datetime
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional; it parses the JSONL lines much faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
 
 def get_claude_dir():
     """Get the Claude Code directory."""
@@ -38,7 +47,8 @@ def get_projects_dir(workspace=None):
             print(f"Error: Projects directory not found at {projects_base}", file=sys.stderr)
             sys.exit(1)
 
-        subdirs = [d for d in projects_base.iterdir() if d.is_dir()]
+        with os.scandir(projects_base) as entries:
+            subdirs = [Path(entry.path) for entry in entries if entry.is_dir()]
         if not subdirs:
             print(f"Error: No workspace directories found in {projects_base}", file=sys.stderr)
             sys.exit(1)
@@ -48,38 +58,39 @@ def get_projects_dir(workspace=None):
 
     return projects_dir
 
+def scan_session_files(projects_dir):
+    """Find session files as (path, stat) pairs, stat'ing each file only once."""
+    session_files = []
+    with os.scandir(projects_dir) as entries:
+        for entry in entries:
+            # Same files as glob("*.jsonl"), which skips hidden files
+            if entry.name.endswith('.jsonl') and not entry.name.startswith('.'):
+                session_files.append((Path(entry.path), entry.stat()))
+    return session_files
+
 def list_sessions(limit=10):
     """List recent sessions with metadata."""
     projects_dir = get_projects_dir()
 
     # Get all session files sorted by modification time
     session_files = sorted(
-        projects_dir.glob("*.jsonl"),
-        key=lambda f: f.stat().st_mtime,
+        scan_session_files(projects_dir),
+        key=lambda f: f[1].st_mtime,
         reverse=True
     )
 
     print(f"Recent sessions in {projects_dir.name}:")
     print("-" * 80)
 
-    for i, session_file in enumerate(session_files[:limit]):
+    # Count messages in all listed sessions at once; each count reads a whole file
+    session_files = session_files[:limit]
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        message_counts = list(executor.map(count_messages, [f for f, _ in session_files]))
+
+    for i, ((session_file, stat), message_count) in enumerate(zip(session_files, message_counts)):
         session_id = session_file.stem
-        mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
-        size = session_file.stat().st_size
-
-        # Count messages
-        message_count = 0
-        try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        data = json.loads(line)
-                        if data.get('type') in ['user', 'assistant']:
-                            message_count += 1
-                    except json.JSONDecodeError:
-                        continue
-        except Exception as e:
-            message_count = "?"
+        mtime = datetime.fromtimestamp(stat.st_mtime)
+        size = stat.st_size
 
         print(f"{i+1}. Session: {session_id}")
         print(f"   Modified: {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -87,6 +98,22 @@ def list_sessions(limit=10):
         print(f"   Messages: {message_count}")
         print()
 
+def count_messages(session_file):
+    """Count the user and assistant messages in a session file ("?" if unreadable)."""
+    message_count = 0
+    try:
+        with open(session_file, 'rb') as f:
+            for line in f:
+                try:
+                    data = json_loads(line)
+                    if data.get('type') in ['user', 'assistant']:
+                        message_count += 1
+                except json.JSONDecodeError:
+                    continue
+    except Exception as e:
+        message_count = "?"
+    return message_count
+
 def find_session_file(session_id_or_path):
     """Find a session file by ID or path."""
     # Check if it's a direct path
@@ -108,12 +135,12 @@ def get_most_recent_session():
     """Get the most recently modified session file."""
     projects_dir = get_projects_dir()
 
-    session_files = list(projects_dir.glob("*.jsonl"))
+    session_files = scan_session_files(projects_dir)
     if not session_files:
         print(f"Error: No session files found in {projects_dir}", file=sys.stderr)
         sys.exit(1)
 
-    most_recent = max(session_files, key=lambda f: f.stat().st_mtime)
+    most_recent, _ = max(session_files, key=lambda f: f[1].st_mtime)
     return most_recent
 
 def format_message_content(content, include_tool_results=True):
@@ -180,10 +207,10 @@ def parse_session(session_file, output_file=None):
 
     messages = []
 
-    with open(session_file, 'r', encoding='utf-8') as f:
+    with open(session_file, 'rb') as f:
         for line_num, line in enumerate(f, 1):
             try:
-                data = json.loads(line)
+                data = json_loads(line)
 
                 # Extract message data
                 msg_type = data.get('type')